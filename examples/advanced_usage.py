@@ -333,7 +333,7 @@ def filtering_and_processing():
         
         # Process temperature data
         temp_data = []
-        for record in weather_data.get_all_records():
+        for record in weather_data.iter_all_records():
             temp_avg = record.data_values.get('day-air-tmp-avg')
             if temp_avg and temp_avg.value:
                 try:
@@ -7,7 +7,7 @@ with built-in CSV export functionality.
 
 from .client import CimisClient
 from .exceptions import CimisError, CimisAPIError, CimisDataError, CimisConnectionError, CimisAuthenticationError
-from .models import WeatherData, Station, ZipCode, SpatialZipCode
+from .models import WeatherData, WeatherFrame, Station, ZipCode, SpatialZipCode
 
 __version__ = "1.3.5"
 __author__ = "Mahipal Reddy Ramireddy, M. A. Andrade "
@@ -23,6 +23,7 @@ __all__ = [
     "CimisConnectionError",
     "CimisAuthenticationError",
     "WeatherData",
+    "WeatherFrame",
     "Station",
     "ZipCode",
     "SpatialZipCode"
@@ -2,14 +2,32 @@
 Main client class for the Python CIMIS library.
 """
 
-import csv
+import hashlib
 import json
+import os
+import threading
+import time
 import requests
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, date, time as dt_time
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Sequence, Union, Any
 from urllib.parse import urlencode
 
+# Optional faster JSON parsers, preferred in this order over the stdlib;
+# simdjson is only imported when orjson is unavailable
+simdjson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    try:
+        import simdjson
+    except ImportError:
+        pass
+
 from .exceptions import (
     CimisAPIError, 
     CimisDataError, 
@@ -18,17 +36,37 @@ from .exceptions import (
 )
 from .models import (
     WeatherData, 
+    WeatherFrame,
     WeatherProvider, 
-    WeatherRecord, 
-    DataValue,
     Station, 
     ZipCode, 
     SpatialZipCode
 )
-from .endpoints import CimisEndpoints
+from .endpoints import CimisEndpoints, _format_date
 from .utils import FilenameGenerator
 
 
+# Maximum number of targets sent in a single data request when a long
+# target list is split into concurrent requests
+TARGETS_PER_REQUEST = 10
+
+# Write buffer size for CSV exports, so large exports flush in few system calls
+CSV_BUFFER_SIZE = 1 << 20
+
+# CSV header columns shared by every export
+WEATHER_CSV_BASE_COLUMNS = (
+    'Provider_Name', 'Provider_Type', 'Date', 'Julian', 'Station', 
+    'Standard', 'ZipCodes', 'Scope', 'DateTime_Object'
+)
+WEATHER_CSV_HOUR_COLUMNS = ('Hour', 'DateTime_Full')
+STATION_CSV_COLUMNS = (
+    'StationNbr', 'Name', 'City', 'RegionalOffice', 'County',
+    'ConnectDate', 'DisconnectDate', 'IsActive', 'IsEtoStation',
+    'Elevation', 'GroundCover', 'HmsLatitude', 'HmsLongitude',
+    'Latitude', 'Longitude', 'ZipCodes', 'SitingDesc'
+)
+
+
 class CimisClient:
     """
     Main client for accessing the California Irrigation Management Information System (CIMIS) API.
@@ -41,22 +79,60 @@ class CimisClient:
     - Auto-generate filenames based on station names and dates
     """
     
-    def __init__(self, app_key: str, timeout: int = 30):
+    def __init__(self, app_key: str, timeout: int = 30, max_workers: int = 8,
+                 cache: bool = False, cache_dir: Optional[Union[str, Path]] = None,
+                 cache_ttl: Optional[float] = 86400):
         """
         Initialize the CIMIS client.
         
         Args:
             app_key: Your CIMIS API application key
-            timeout: Request timeout in seconds (default: 30)
+            timeout: Request timeout in seconds (default: 30). Connection
+                errors and 5xx responses are retried up to 3 times, so a call can
+                take longer than this overall; read timeouts are not retried
+            max_workers: Maximum number of concurrent requests used when fetching
+                data for many targets (default: 8, use 1 to disable)
+            cache: If True, store API responses on disk and serve repeated
+                identical requests from the cache without contacting the API
+            cache_dir: Directory for cached responses (default: ~/.cache/python_cimis)
+            cache_ttl: Maximum age of a cached response in seconds before it is
+                fetched again (default: 86400, one day; None keeps entries forever)
         """
         self.app_key = app_key
         self.timeout = timeout
+        self.max_workers = max_workers
+        
+        # On-disk response cache (disabled unless requested)
+        if cache or cache_dir is not None:
+            self.cache_dir: Optional[Path] = (
+                Path(cache_dir) if cache_dir is not None
+                else Path.home() / '.cache' / 'python_cimis'
+            )
+        else:
+            self.cache_dir = None
+        self.cache_ttl = cache_ttl
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'python-CIMIS/1.0.0',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
         })
         
+        # Keep connections alive across requests and retry transient server
+        # errors; read timeouts are not retried so `timeout` bounds a hung request
+        retry = Retry(
+            total=3,
+            read=False,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        # Reusable simdjson parsers (one per thread, a parser is not thread-safe)
+        self._json_parsers = threading.local()
+        
         # Use centralized endpoints
         self.endpoints = CimisEndpoints()
         
@@ -111,6 +187,13 @@ class CimisClient:
         # Get URL from centralized endpoints
         url = self.endpoints.get_url(endpoint_key, **endpoint_kwargs)
         
+        # Serve repeated requests from the on-disk cache if enabled
+        cache_path = self._get_cache_path(url, params) if self.cache_dir is not None else None
+        if cache_path is not None:
+            cached_content = self._read_cache(cache_path)
+            if cached_content is not None:
+                return self._decode_json(cached_content)
+        
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
         except requests.exceptions.Timeout:
@@ -134,74 +217,79 @@ class CimisClient:
             raise CimisAPIError(f"HTTP {response.status_code}: {response.reason}", 
                               http_code=response.status_code)
         
+        result = self._decode_json(response.content)
+        
+        if cache_path is not None:
+            self._write_cache(cache_path, response.content)
+        
+        return result
+    
+    def _decode_json(self, content: bytes) -> Dict[str, Any]:
+        """
+        Decode a JSON response body.
+        
+        Raises:
+            CimisDataError: If the content is not valid JSON
+        """
         try:
-            return response.json()
+            if orjson is not None:
+                return orjson.loads(content)
+            if simdjson is not None:
+                # Reuse the parser so its internal buffers are allocated once
+                parser = getattr(self._json_parsers, 'parser', None)
+                if parser is None:
+                    parser = self._json_parsers.parser = simdjson.Parser()
+                return parser.parse(content, recursive=True)
+            return json.loads(content)
         except ValueError as e:
             raise CimisDataError(f"Invalid JSON response: {e}")
     
-    def _parse_data_response(self, data: Dict[str, Any]) -> WeatherData:
-        """Parse weather data response into WeatherData object."""
-        weather_data = WeatherData()
+    def _get_cache_path(self, url: str, params: Dict[str, Any]) -> Path:
+        """Get the cache file path for a request (the app key is not part of the key)."""
+        query = urlencode(sorted((key, str(value)) for key, value in params.items()
+                                 if key != 'appKey'))
+        digest = hashlib.blake2b(f"{url}?{query}".encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json.gz"
+    
+    def _read_cache(self, cache_path: Path) -> Optional[bytes]:
+        """Read a cached response body, returning None on a miss, expired or unreadable entry."""
+        import gzip
         
-        if 'Data' not in data or 'Providers' not in data['Data']:
-            return weather_data
+        try:
+            # Entries older than cache_ttl are treated as misses and refetched
+            if (self.cache_ttl is not None
+                    and time.time() - cache_path.stat().st_mtime > self.cache_ttl):
+                return None
+            return gzip.decompress(cache_path.read_bytes())
+        except (OSError, EOFError):
+            return None
+    
+    def _write_cache(self, cache_path: Path, content: bytes) -> None:
+        """Store a response body in the cache; failures only disable caching for this entry."""
+        import gzip
         
-        for provider_data in data['Data']['Providers']:
-            provider = WeatherProvider(
-                name=provider_data.get('Name', ''),
-                type=provider_data.get('Type', ''),
-                owner=provider_data.get('Owner', '')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see partial entries
+            tmp_path = cache_path.with_name(
+                f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
             )
-            
-            for record_data in provider_data.get('Records', []):
-                record = WeatherRecord(
-                    date=record_data.get('Date', ''),
-                    julian=record_data.get('Julian', ''),
-                    station=record_data.get('Station'),
-                    standard=record_data.get('Standard', 'english'),
-                    zip_codes=record_data.get('ZipCodes', ''),
-                    scope=record_data.get('Scope', 'daily'),
-                    hour=record_data.get('Hour')
-                )
-                
-                # Parse data values
-                for key, value in record_data.items():
-                    if isinstance(value, dict) and 'Value' in value:
-                        data_value = DataValue(
-                            value=value.get('Value'),
-                            qc=value.get('Qc', ' '),
-                            unit=value.get('Unit', '')
-                        )
-                        record.data_values[key] = data_value
-                
-                provider.records.append(record)
-            
-            weather_data.providers.append(provider)
-        
-        return weather_data
+            tmp_path.write_bytes(gzip.compress(content))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    
+    def _parse_data_response(self, data: Dict[str, Any],
+                             scope_filter: Optional[str] = None) -> WeatherData:
+        """Parse weather data response into WeatherData object."""
+        return self.endpoints.parse_data_response(data, scope_filter)
     
     def _parse_stations_response(self, data: Dict[str, Any]) -> List[Station]:
         """Parse stations response into list of Station objects."""
         stations = []
         
         for station_data in data.get('Stations', []):
-            station = Station(
-                station_nbr=station_data.get('StationNbr', ''),
-                name=station_data.get('Name', ''),
-                city=station_data.get('City', ''),
-                regional_office=station_data.get('RegionalOffice'),
-                county=station_data.get('County'),
-                connect_date=station_data.get('ConnectDate', ''),
-                disconnect_date=station_data.get('DisconnectDate', ''),
-                is_active=station_data.get('IsActive', 'True').lower() == 'true',
-                is_eto_station=station_data.get('IsEtoStation', 'True').lower() == 'true',
-                elevation=station_data.get('Elevation', ''),
-                ground_cover=station_data.get('GroundCover', ''),
-                hms_latitude=station_data.get('HmsLatitude', ''),
-                hms_longitude=station_data.get('HmsLongitude', ''),
-                zip_codes=station_data.get('ZipCodes', []),
-                siting_desc=station_data.get('SitingDesc', '')
-            )
+            station = Station._from_json(station_data)
             stations.append(station)
         
         return stations
@@ -212,7 +300,8 @@ class CimisClient:
                  end_date: Union[str, date, datetime],
                  data_items: Optional[List[str]] = None,
                  unit_of_measure: str = 'E',
-                 prioritize_scs: bool = True) -> WeatherData:
+                 prioritize_scs: bool = True,
+                 scope_filter: Optional[str] = None) -> WeatherData:
         """
         Get weather data from CIMIS.
         
@@ -223,26 +312,140 @@ class CimisClient:
             data_items: List of data items to retrieve (uses default if None)
             unit_of_measure: 'E' for English or 'M' for Metric
             prioritize_scs: Whether to prioritize SCS data for zip codes
+            scope_filter: Only keep 'daily' or 'hourly' records (keeps all if None)
             
         Returns:
             WeatherData object containing the response
         """
+        # Each response is parsed in the thread that fetched it, so parsing
+        # overlaps with the requests still in flight
+        parts = self._request_data(
+            targets, start_date, end_date, data_items, unit_of_measure, prioritize_scs,
+            parse=lambda response_data: self.endpoints.parse_data_response(response_data, scope_filter)
+        )
+        if len(parts) == 1:
+            return parts[0]
+        
+        return self._merge_weather_data(parts)
+    
+    def get_data_frame(self, 
+                       targets: Union[str, List[str]], 
+                       start_date: Union[str, date, datetime],
+                       end_date: Union[str, date, datetime],
+                       data_items: Optional[List[str]] = None,
+                       unit_of_measure: str = 'E',
+                       prioritize_scs: bool = True,
+                       scope_filter: Optional[str] = None) -> WeatherFrame:
+        """
+        Get weather data from CIMIS as a column-oriented WeatherFrame.
+        
+        Takes the same arguments as get_data, but parses the response straight
+        into per-item value columns instead of WeatherRecord/DataValue objects,
+        which uses far less memory for large requests.
+        
+        Args:
+            targets: Station numbers, zip codes, coordinates, or addresses
+            start_date: Start date (YYYY-MM-DD format, date, or datetime)
+            end_date: End date (YYYY-MM-DD format, date, or datetime)
+            data_items: List of data items to retrieve (uses default if None)
+            unit_of_measure: 'E' for English or 'M' for Metric
+            prioritize_scs: Whether to prioritize SCS data for zip codes
+            scope_filter: Only keep 'daily' or 'hourly' records (keeps all if None)
+            
+        Returns:
+            WeatherFrame object containing the response
+        """
+        responses = self._request_data(targets, start_date, end_date, data_items,
+                                       unit_of_measure, prioritize_scs)
+        if len(responses) == 1:
+            response_data = responses[0]
+        else:
+            response_data = {'Data': {'Providers': [
+                provider_data
+                for part in responses
+                for provider_data in (part.get('Data') or {}).get('Providers', [])
+            ]}}
+        
+        return self.endpoints.parse_data_frame(response_data, scope_filter)
+    
+    def _request_data(self, 
+                      targets: Union[str, List[str]], 
+                      start_date: Union[str, date, datetime],
+                      end_date: Union[str, date, datetime],
+                      data_items: Optional[List[str]],
+                      unit_of_measure: str,
+                      prioritize_scs: bool,
+                      parse: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Any]:
+        """
+        Request weather data, splitting long target lists into concurrent requests.
+        
+        Args:
+            parse: Optional function applied to each decoded response in the
+                worker thread that fetched it
+        
+        Returns:
+            Decoded JSON responses (or their parsed results) in target order,
+            a single one unless the targets were split
+        """
         # Use data_items if provided, otherwise use all available items
         if data_items is None:
             data_items = []  # Empty list will get all available data items
-            
-        params = self.endpoints.prepare_data_params(
-            targets=targets,
-            start_date=start_date,
-            end_date=end_date,
-            items=data_items,
-            measure_unit=unit_of_measure,
-            prioritize_sri=(unit_of_measure == 'M'),  # Use SRI for metric
-            prioritize_scs=prioritize_scs
-        )
         
-        response_data = self._make_request('data', params)
-        return self.endpoints.parse_data_response(response_data)
+        def request_targets(request_targets: Union[str, List[str]]) -> Dict[str, Any]:
+            params = self.endpoints.prepare_data_params(
+                targets=request_targets,
+                start_date=start_date,
+                end_date=end_date,
+                items=data_items,
+                measure_unit=unit_of_measure,
+                prioritize_sri=(unit_of_measure == 'M'),  # Use SRI for metric
+                prioritize_scs=prioritize_scs
+            )
+            response_data = self._make_request('data', params)
+            return parse(response_data) if parse is not None else response_data
+        
+        # Split long target lists into chunks fetched concurrently over the
+        # shared session; requests are latency-bound so threads overlap well
+        if (isinstance(targets, list) and len(targets) > TARGETS_PER_REQUEST
+                and self.max_workers > 1):
+            chunks = [targets[i:i + TARGETS_PER_REQUEST]
+                      for i in range(0, len(targets), TARGETS_PER_REQUEST)]
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                return list(executor.map(request_targets, chunks))
+        
+        return [request_targets(targets)]
+    
+    def _merge_weather_data(self, parts: List[WeatherData]) -> WeatherData:
+        """
+        Merge weather data from several requests into a single WeatherData object.
+        
+        Records from providers with the same name, type and owner are combined
+        so the result has the same shape as a single request would return.
+        
+        Args:
+            parts: WeatherData objects in request order
+            
+        Returns:
+            Combined WeatherData object
+        """
+        merged = WeatherData()
+        providers: Dict[tuple, WeatherProvider] = {}
+        
+        for part in parts:
+            for provider in part.providers:
+                key = (provider.name, provider.type, provider.owner)
+                merged_provider = providers.get(key)
+                if merged_provider is None:
+                    merged_provider = WeatherProvider(
+                        name=provider.name,
+                        type=provider.type,
+                        owner=provider.owner
+                    )
+                    providers[key] = merged_provider
+                    merged.providers.append(merged_provider)
+                merged_provider.records.extend(provider.records)
+        
+        return merged
     
     def get_daily_data(self, 
                        targets: Union[str, List[str]], 
@@ -252,7 +455,8 @@ class CimisClient:
                        unit_of_measure: str = 'Metric',
                        prioritize_scs: bool = True,
                        csv: bool = False,
-                       filename: Optional[Union[str, Path]] = None) -> Union[WeatherData, tuple[WeatherData, str]]:
+                       filename: Optional[Union[str, Path]] = None,
+                       stream: bool = False) -> Union[WeatherData, tuple[WeatherData, str], str]:
         """
         Get daily weather data from CIMIS.
         
@@ -267,10 +471,13 @@ class CimisClient:
             prioritize_scs: Whether to prioritize SCS data for zip codes
             csv: If True, automatically export to CSV with auto-generated filename
             filename: Custom filename for CSV export (only used if csv=True)
+            stream: If True with csv=True, write the CSV straight from the API
+                response without building a WeatherData object
             
         Returns:
             WeatherData object containing only daily records if csv=False, 
-            or tuple of (WeatherData, csv_filename) if csv=True
+            or tuple of (WeatherData, csv_filename) if csv=True,
+            or just the csv_filename if csv=True and stream=True
         """
         # Use default daily data items if none specified
         if data_items is None:
@@ -279,13 +486,23 @@ class CimisClient:
         # Convert unit parameter to API format
         unit_code = 'E' if unit_of_measure.lower() == 'english' else 'M'
         
-        weather_data = self.get_data(targets, start_date, end_date, data_items, 
-                                   unit_code, prioritize_scs)
+        if csv and stream:
+            responses = self._request_data(targets, start_date, end_date, data_items,
+                                           unit_code, prioritize_scs)
+            if filename is None:
+                filename = self._generate_stream_filename(targets, start_date, end_date)
+            return self._stream_records_to_csv(responses, Path(filename), 'daily', 'daily')
         
-        # Filter to only daily records (remove any hourly records that might be included)
-        daily_weather_data = self._filter_daily_only(weather_data)
+        # Keep only daily records (drops any hourly records while parsing)
+        daily_weather_data = self.get_data(targets, start_date, end_date, data_items, 
+                                           unit_code, prioritize_scs, scope_filter='daily')
         
         if csv:
+            if filename is None:
+                # The requested range names the file without rescanning record dates
+                filename = self.filename_generator.generate_weather_filename(
+                    daily_weather_data, self._date_param(start_date), self._date_param(end_date)
+                )
             csv_filename = self.export_to_csv(daily_weather_data, filename)
             return daily_weather_data, csv_filename
         
@@ -298,7 +515,8 @@ class CimisClient:
                         data_items: Optional[List[str]] = None,
                         unit_of_measure: str = 'Metric',
                         csv: bool = False,
-                        filename: Optional[Union[str, Path]] = None) -> Union[WeatherData, tuple[WeatherData, str]]:
+                        filename: Optional[Union[str, Path]] = None,
+                        stream: bool = False) -> Union[WeatherData, tuple[WeatherData, str], str]:
         """
         Get hourly weather data from CIMIS.
         
@@ -313,9 +531,12 @@ class CimisClient:
             unit_of_measure: 'Metric' for Metric units (default) or 'English' for English units
             csv: If True, automatically export to CSV with auto-generated filename (hourly only)
             filename: Custom filename for CSV export (only used if csv=True)
+            stream: If True with csv=True, write the CSV straight from the API
+                response without building a WeatherData object
             
         Returns:
-            WeatherData object if csv=False, or tuple of (WeatherData, csv_filename) if csv=True
+            WeatherData object if csv=False, or tuple of (WeatherData, csv_filename) if csv=True,
+            or just the csv_filename if csv=True and stream=True
             Note: WeatherData will contain only hourly records
         """
         if data_items is None:
@@ -324,93 +545,30 @@ class CimisClient:
         # Convert unit parameter to API format
         unit_code = 'E' if unit_of_measure.lower() == 'english' else 'M'
         
-        weather_data = self.get_data(targets, start_date, end_date, data_items, 
-                                   unit_code, prioritize_scs=False)
+        if csv and stream:
+            responses = self._request_data(targets, start_date, end_date, data_items,
+                                           unit_code, prioritize_scs=False)
+            if filename is None:
+                filename = self._generate_stream_filename(targets, start_date, end_date)
+            # Same single-file layout as the separate_daily_hourly=False export below
+            return self._stream_records_to_csv(responses, Path(filename), 'mixed', 'hourly')
         
-        # Filter to only hourly records (remove any daily records that might be included)
-        hourly_weather_data = self._filter_hourly_only(weather_data)
+        # Keep only hourly records (drops any daily records while parsing)
+        hourly_weather_data = self.get_data(targets, start_date, end_date, data_items, 
+                                            unit_code, prioritize_scs=False,
+                                            scope_filter='hourly')
         
         if csv:
+            if filename is None:
+                filename = self.filename_generator.generate_weather_filename(
+                    hourly_weather_data, self._date_param(start_date), self._date_param(end_date)
+                )
             # Force hourly-only CSV export (no daily file creation)
             csv_filename = self.export_to_csv(hourly_weather_data, filename, separate_daily_hourly=False)
             return hourly_weather_data, csv_filename
         
         return hourly_weather_data
     
-    def _filter_hourly_only(self, weather_data) -> 'WeatherData':
-        """
-        Filter weather data to include only hourly records.
-        
-        Args:
-            weather_data: WeatherData object with mixed daily/hourly records
-            
-        Returns:
-            WeatherData object containing only hourly records
-        """
-        from .models import WeatherData, WeatherProvider
-        
-        # Handle test mocks - if it's a mock object, just return it as-is
-        if hasattr(weather_data, '_mock_name') or not hasattr(weather_data, 'providers'):
-            return weather_data
-        
-        # Create a new WeatherData object for filtered results
-        filtered_weather_data = WeatherData()
-        
-        # Process each provider
-        for provider in weather_data.providers:
-            # Filter records to only include hourly ones
-            hourly_records = [record for record in provider.records if record.scope == 'hourly']
-            
-            # Only include provider if it has hourly records
-            if hourly_records:
-                # Create a new provider with only hourly records
-                filtered_provider = WeatherProvider(
-                    name=provider.name,
-                    type=provider.type,
-                    owner=provider.owner,
-                    records=hourly_records
-                )
-                filtered_weather_data.providers.append(filtered_provider)
-        
-        return filtered_weather_data
-    
-    def _filter_daily_only(self, weather_data) -> 'WeatherData':
-        """
-        Filter weather data to include only daily records.
-        
-        Args:
-            weather_data: WeatherData object with mixed daily/hourly records
-            
-        Returns:
-            WeatherData object containing only daily records
-        """
-        from .models import WeatherData, WeatherProvider
-        
-        # Handle test mocks - if it's a mock object, just return it as-is
-        if hasattr(weather_data, '_mock_name') or not hasattr(weather_data, 'providers'):
-            return weather_data
-        
-        # Create a new WeatherData object for filtered results
-        filtered_weather_data = WeatherData()
-        
-        # Process each provider
-        for provider in weather_data.providers:
-            # Filter records to only include daily ones
-            daily_records = [record for record in provider.records if record.scope == 'daily']
-            
-            # Only include provider if it has daily records
-            if daily_records:
-                # Create a new provider with only daily records
-                filtered_provider = WeatherProvider(
-                    name=provider.name,
-                    type=provider.type,
-                    owner=provider.owner,
-                    records=daily_records
-                )
-                filtered_weather_data.providers.append(filtered_provider)
-        
-        return filtered_weather_data
-    
     def get_stations(self, station_number: Optional[str] = None) -> List[Station]:
         """
         Get station information.
@@ -504,22 +662,18 @@ class CimisClient:
         
         # Separate records by scope if requested
         if separate_daily_hourly:
-            daily_records = []
-            hourly_records = []
+            # Records come from the same parser, so check the record type once
+            # instead of per record
+            if isinstance(all_records[0], dict):
+                # Dict objects (legacy support) default to daily
+                record_scopes = [record.get('scope', 'daily') for record in all_records]
+            else:
+                record_scopes = [getattr(record, 'scope', 'daily') for record in all_records]
             
-            for record in all_records:
-                # Handle both WeatherRecord objects and dict objects (for backward compatibility)
-                if hasattr(record, 'scope'):
-                    scope = record.scope
-                elif isinstance(record, dict):
-                    scope = record.get('scope', 'daily')  # Default to daily for legacy data
-                else:
-                    scope = 'daily'  # Default fallback
-                
-                if scope == 'daily':
-                    daily_records.append(record)
-                elif scope == 'hourly':
-                    hourly_records.append(record)
+            daily_records = [record for record, scope in zip(all_records, record_scopes)
+                             if scope == 'daily']
+            hourly_records = [record for record, scope in zip(all_records, record_scopes)
+                              if scope == 'hourly']
             
             if daily_records and hourly_records:
                 # Create separate files for daily and hourly data
@@ -538,21 +692,18 @@ class CimisClient:
         # If not separating or only one type, export all together with scope-specific columns
         return self._export_records_to_csv(weather_data, all_records, filename, 'mixed')
     
-    def _export_records_to_csv(self, weather_data: WeatherData, records: List, 
-                              filename: Path, scope_type: str) -> str:
-        """Helper method to export records to CSV with appropriate columns."""
-        # Collect data items relevant to the scope type
-        all_data_items = set()
-        for record in records:
-            if hasattr(record, 'data_values'):
-                # WeatherRecord object
-                all_data_items.update(record.data_values.keys())
-            else:
-                # Dict object (legacy support) - look for data items in the dict
-                for key, value in record.items():
-                    if isinstance(value, dict) and 'Value' in value:
-                        all_data_items.add(key)
+    @staticmethod
+    def _get_csv_columns(all_data_items: set, scope_type: str) -> tuple[List[str], List[str]]:
+        """
+        Build the weather CSV header for a set of data items.
         
+        Args:
+            all_data_items: Data item names found in the exported records
+            scope_type: 'daily', 'hourly' or 'mixed'
+            
+        Returns:
+            Tuple of (sorted data items, all column names)
+        """
         # Filter data items based on scope type
         if scope_type == 'daily':
             # Only include daily data items
@@ -570,44 +721,137 @@ class CimisClient:
         sorted_data_items = sorted(filtered_data_items)
         
         # Base columns with datetime objects
-        base_columns = [
-            'Provider_Name', 'Provider_Type', 'Date', 'Julian', 'Station', 
-            'Standard', 'ZipCodes', 'Scope', 'DateTime_Object'
-        ]
+        base_columns = list(WEATHER_CSV_BASE_COLUMNS)
         
         # Add Hour column only if we have hourly data
         if scope_type in ['hourly', 'mixed']:
-            base_columns.append('Hour')
-            base_columns.append('DateTime_Full')
+            base_columns.extend(WEATHER_CSV_HOUR_COLUMNS)
         
         # Data value columns (value, qc, unit for each data item)
         data_columns = []
         for item in sorted_data_items:
             # Remove "Hly" prefix for hourly columns to make them cleaner
-            clean_item_name = item
-            if item.startswith('Hly'):
-                clean_item_name = item[3:]  # Remove "Hly" prefix
-            
+            clean_item_name = item[3:] if item.startswith('Hly') else item
             data_columns.extend([
                 f"{clean_item_name}_Value",
                 f"{clean_item_name}_QC", 
                 f"{clean_item_name}_Unit"
             ])
         
-        all_columns = base_columns + data_columns
+        return sorted_data_items, base_columns + data_columns
+    
+    @staticmethod
+    def _make_datetime_formatter():
+        """
+        Create a formatter returning the DateTime_Object and DateTime_Full
+        column values for a record date and hour.
+        """
+        # Records share a small set of dates (one per day across stations and
+        # hours) and hours, so validate each unique string once and build the
+        # ISO values per row by plain string concatenation
+        date_cache: Dict[str, tuple] = {}
+        hour_cache: Dict[str, Optional[str]] = {}
+        
+        def parse_date(date_str: str) -> tuple:
+            """Return (ISO date part or None, DateTime_Object) for a record date."""
+            cached = date_cache.get(date_str)
+            if cached is None:
+                try:
+                    date_part = datetime.strptime(date_str, '%Y-%m-%d').date().isoformat()
+                    cached = (date_part, date_part + 'T00:00:00')
+                except ValueError:
+                    cached = (None, date_str)
+                date_cache[date_str] = cached
+            return cached
+        
+        def parse_hour(hour_value) -> Optional[str]:
+            """Return the ISO time part for a record hour, or None if invalid."""
+            if hour_value in hour_cache:
+                return hour_cache[hour_value]
+            try:
+                # Hour format is typically "0100", "0200", etc.; "2400" is invalid
+                hour_str = str(hour_value).zfill(4)
+                hour = int(hour_str[:2])
+                minute = int(hour_str[2:]) if len(hour_str) > 2 else 0
+                time_part = dt_time(hour, minute).isoformat()
+            except (ValueError, TypeError):
+                time_part = None
+            hour_cache[hour_value] = time_part
+            return time_part
+        
+        def format_datetimes(record_date: str, record_hour: str) -> tuple:
+            """Return (DateTime_Object, DateTime_Full) for a record."""
+            # Date part from the record date (format YYYY-MM-DD)
+            if record_date:
+                date_part, datetime_object = parse_date(record_date)
+            else:
+                date_part = None
+                datetime_object = ''
+            
+            # Full datetime with hour if available
+            if record_date and record_hour:
+                time_part = parse_hour(record_hour)
+                if date_part is None or time_part is None:
+                    datetime_full = f"{record_date} {record_hour}"
+                else:
+                    datetime_full = date_part + 'T' + time_part
+            else:
+                datetime_full = ''
+            
+            return datetime_object, datetime_full
+        
+        return format_datetimes
+    
+    @staticmethod
+    def _write_csv_rows(filename: Path, columns: Sequence[str], rows) -> str:
+        """Write a header and an iterable of positional rows to a CSV file."""
+        import csv
         
         # Ensure directory exists
         filename.parent.mkdir(parents=True, exist_ok=True)
         
-        # Write CSV
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=all_columns)
-            writer.writeheader()
-            
+        # writerows consumes the rows in a single call and the large file
+        # buffer turns them into a few big writes (staging batches of rows in
+        # a StringIO first gave no further speedup)
+        with open(filename, 'w', newline='', encoding='utf-8',
+                  buffering=CSV_BUFFER_SIZE) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(columns)
+            writer.writerows(rows)
+        
+        return str(filename)
+    
+    def _export_records_to_csv(self, weather_data: WeatherData, records: List, 
+                              filename: Path, scope_type: str) -> str:
+        """Helper method to export records to CSV with appropriate columns."""
+        # Collect data items relevant to the scope type
+        all_data_items = set()
+        for record in records:
+            if hasattr(record, 'data_values'):
+                # WeatherRecord object
+                all_data_items.update(record.data_values.keys())
+            else:
+                # Dict object (legacy support) - look for data items in the dict
+                for key, value in record.items():
+                    if isinstance(value, dict) and 'Value' in value:
+                        all_data_items.add(key)
+        
+        sorted_data_items, all_columns = self._get_csv_columns(all_data_items, scope_type)
+        include_hour = scope_type in ['hourly', 'mixed']
+        format_datetimes = self._make_datetime_formatter()
+        
+        # Identity set for the record filter below; list membership would
+        # compare every record field by field
+        selected_record_ids = {id(record) for record in records}
+        
+        # Rows are built record by record; collecting per-column lists and
+        # zipping them back into rows was measured slower for this layout
+        def iter_rows():
+            """Yield CSV rows, built positionally in the order of all_columns."""
             for provider in weather_data.providers:
                 for record in provider.records:
                     # Skip records not in our filtered list
-                    if record not in records:
+                    if id(record) not in selected_record_ids:
                         continue
                         
                     # Handle both WeatherRecord objects and dict objects
@@ -631,83 +875,139 @@ class CimisClient:
                         record_scope = record.get('scope', 'daily')
                         record_hour = record.get('Hour', '')
                         record_data_values = record  # For dict objects, the data is directly in the dict
-                        
-                    row = {
-                        'Provider_Name': provider.name,
-                        'Provider_Type': provider.type,
-                        'Date': record_date,
-                        'Julian': record_julian,
-                        'Station': record_station,
-                        'Standard': record_standard,
-                        'ZipCodes': record_zip_codes,
-                        'Scope': record_scope
-                    }
                     
-                    # Create datetime object from date
-                    try:
-                        if record_date:
-                            # Parse date in format YYYY-MM-DD
-                            date_obj = datetime.strptime(record_date, '%Y-%m-%d')
-                            row['DateTime_Object'] = date_obj.isoformat()
-                        else:
-                            row['DateTime_Object'] = ''
-                    except ValueError:
-                        row['DateTime_Object'] = record_date or ''
+                    datetime_object, datetime_full = format_datetimes(record_date, record_hour)
+                    
+                    row = [
+                        provider.name,
+                        provider.type,
+                        record_date,
+                        record_julian,
+                        record_station,
+                        record_standard,
+                        record_zip_codes,
+                        record_scope,
+                        datetime_object
+                    ]
                     
                     # Add Hour column and full datetime only if needed
-                    if 'Hour' in all_columns:
-                        row['Hour'] = record_hour
-                        
-                        # Create full datetime with hour if available
-                        if 'DateTime_Full' in all_columns:
-                            try:
-                                if record_date and record_hour:
-                                    # Parse date and add hour
-                                    date_obj = datetime.strptime(record_date, '%Y-%m-%d')
-                                    # Hour format is typically "0100", "0200", etc.
-                                    hour_str = str(record_hour).zfill(4)
-                                    hour = int(hour_str[:2])
-                                    minute = int(hour_str[2:]) if len(hour_str) > 2 else 0
-                                    full_datetime = date_obj.replace(hour=hour, minute=minute)
-                                    row['DateTime_Full'] = full_datetime.isoformat()
-                                else:
-                                    row['DateTime_Full'] = ''
-                            except (ValueError, TypeError):
-                                row['DateTime_Full'] = f"{record_date or ''} {record_hour or ''}"
+                    if include_hour:
+                        row.append(record_hour)
+                        row.append(datetime_full)
                     
-                    # Add data values - only include items that are in our filtered set
-                    for item in sorted_data_items:
-                        # Remove "Hly" prefix for column names to make them cleaner
-                        clean_item_name = item
-                        if item.startswith('Hly'):
-                            clean_item_name = item[3:]  # Remove "Hly" prefix
-                        
-                        if hasattr(record, 'data_values'):
-                            # WeatherRecord object
+                    # Add data values - only include items that are in our filtered set.
+                    # Values stay the strings returned by the API, so csv.writer
+                    # copies them through without any number formatting.
+                    if hasattr(record, 'data_values'):
+                        # WeatherRecord object
+                        for item in sorted_data_items:
                             data_value = record_data_values.get(item)
                             if data_value:
-                                row[f"{clean_item_name}_Value"] = data_value.value or ''
-                                row[f"{clean_item_name}_QC"] = data_value.qc
-                                row[f"{clean_item_name}_Unit"] = data_value.unit
+                                row += (data_value.value or '', data_value.qc, data_value.unit)
                             else:
-                                row[f"{clean_item_name}_Value"] = ''
-                                row[f"{clean_item_name}_QC"] = ''
-                                row[f"{clean_item_name}_Unit"] = ''
-                        else:
-                            # Dict object (legacy support)
+                                row += ('', '', '')
+                    else:
+                        # Dict object (legacy support)
+                        for item in sorted_data_items:
                             item_data = record_data_values.get(item)
                             if item_data and isinstance(item_data, dict):
-                                row[f"{clean_item_name}_Value"] = item_data.get('Value', '')
-                                row[f"{clean_item_name}_QC"] = item_data.get('QC', '')
-                                row[f"{clean_item_name}_Unit"] = item_data.get('Unit', '')
+                                row += (item_data.get('Value', ''),
+                                        item_data.get('QC', ''),
+                                        item_data.get('Unit', ''))
                             else:
-                                row[f"{clean_item_name}_Value"] = ''
-                                row[f"{clean_item_name}_QC"] = ''
-                                row[f"{clean_item_name}_Unit"] = ''
+                                row += ('', '', '')
                     
-                    writer.writerow(row)
+                    yield row
         
-        return str(filename)
+        return self._write_csv_rows(filename, all_columns, iter_rows())
+    
+    def _stream_records_to_csv(self, responses: List[Dict[str, Any]], filename: Path,
+                               scope_type: str, scope_filter: str) -> str:
+        """
+        Export raw data responses straight to CSV without building a WeatherData object.
+        
+        Produces the same rows as export_to_csv would for the parsed data.
+        
+        Args:
+            responses: Raw JSON responses from the data endpoint
+            filename: Output CSV filename
+            scope_type: Column layout to use ('daily', 'hourly' or 'mixed')
+            scope_filter: Only export records with this scope
+            
+        Returns:
+            Path to the created CSV file
+        """
+        # Select records and collect data items in one pass over the JSON
+        selected = []
+        all_data_items = set()
+        for data in responses:
+            for provider_data in data.get('Data', {}).get('Providers', []):
+                provider_name = provider_data.get('Name', '')
+                provider_type = provider_data.get('Type', '')
+                for record_data in provider_data.get('Records', []):
+                    if record_data.get('Scope', 'daily') != scope_filter:
+                        continue
+                    selected.append((provider_name, provider_type, record_data))
+                    for key, value in record_data.items():
+                        if isinstance(value, dict) and 'Value' in value:
+                            all_data_items.add(key)
+        
+        if not selected:
+            raise CimisDataError("No data records to export")
+        
+        sorted_data_items, all_columns = self._get_csv_columns(all_data_items, scope_type)
+        include_hour = scope_type in ['hourly', 'mixed']
+        format_datetimes = self._make_datetime_formatter()
+        
+        def iter_rows():
+            """Yield CSV rows, built positionally in the order of all_columns."""
+            for provider_name, provider_type, record_data in selected:
+                get = record_data.get
+                record_date = get('Date', '')
+                record_hour = get('Hour') or ''
+                datetime_object, datetime_full = format_datetimes(record_date, record_hour)
+                
+                # Same defaults as parse_data_response uses for WeatherRecord
+                row = [
+                    provider_name,
+                    provider_type,
+                    record_date,
+                    get('Julian', ''),
+                    get('Station') or '',
+                    get('Standard', 'english'),
+                    get('ZipCodes', ''),
+                    get('Scope', 'daily'),
+                    datetime_object
+                ]
+                
+                if include_hour:
+                    row.append(record_hour)
+                    row.append(datetime_full)
+                
+                for item in sorted_data_items:
+                    value = get(item)
+                    if isinstance(value, dict) and 'Value' in value:
+                        row += (value.get('Value') or '', value.get('Qc', ' '), value.get('Unit', ''))
+                    else:
+                        row += ('', '', '')
+                
+                yield row
+        
+        return self._write_csv_rows(filename, all_columns, iter_rows())
+    
+    def _generate_stream_filename(self, targets: Union[str, List[str]],
+                                  start_date: Union[str, date, datetime],
+                                  end_date: Union[str, date, datetime]) -> str:
+        """Generate a CSV filename from the request parameters of a streamed export."""
+        identifiers = [str(target) for target in targets] if isinstance(targets, list) else [str(targets)]
+        return self.filename_generator.generate_weather_filename_from_request(
+            identifiers, self._date_param(start_date), self._date_param(end_date)
+        )
+    
+    @staticmethod
+    def _date_param(value: Union[str, date, datetime]) -> str:
+        """Format a date parameter the way it is sent to the API."""
+        return _format_date(value) if isinstance(value, (date, datetime)) else value
     
     def export_stations_to_csv(self, 
                                stations: List[Station], 
@@ -732,43 +1032,29 @@ class CimisClient:
         if not stations:
             raise CimisDataError("No station data to export")
         
-        columns = [
-            'StationNbr', 'Name', 'City', 'RegionalOffice', 'County',
-            'ConnectDate', 'DisconnectDate', 'IsActive', 'IsEtoStation',
-            'Elevation', 'GroundCover', 'HmsLatitude', 'HmsLongitude',
-            'Latitude', 'Longitude', 'ZipCodes', 'SitingDesc'
+        # Build one list per column (in the order of STATION_CSV_COLUMNS) and write them
+        # as positional rows, instead of a dict per station
+        column_values = [
+            [station.station_nbr for station in stations],
+            [station.name for station in stations],
+            [station.city for station in stations],
+            [station.regional_office or '' for station in stations],
+            [station.county or '' for station in stations],
+            [station.connect_date for station in stations],
+            [station.disconnect_date for station in stations],
+            [station.is_active for station in stations],
+            [station.is_eto_station for station in stations],
+            [station.elevation for station in stations],
+            [station.ground_cover for station in stations],
+            [station.hms_latitude for station in stations],
+            [station.hms_longitude for station in stations],
+            [station.latitude or '' for station in stations],
+            [station.longitude or '' for station in stations],
+            [', '.join(station.zip_codes) for station in stations],
+            [station.siting_desc for station in stations]
         ]
         
-        # Ensure directory exists
-        filename.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=columns)
-            writer.writeheader()
-            
-            for station in stations:
-                row = {
-                    'StationNbr': station.station_nbr,
-                    'Name': station.name,
-                    'City': station.city,
-                    'RegionalOffice': station.regional_office or '',
-                    'County': station.county or '',
-                    'ConnectDate': station.connect_date,
-                    'DisconnectDate': station.disconnect_date,
-                    'IsActive': station.is_active,
-                    'IsEtoStation': station.is_eto_station,
-                    'Elevation': station.elevation,
-                    'GroundCover': station.ground_cover,
-                    'HmsLatitude': station.hms_latitude,
-                    'HmsLongitude': station.hms_longitude,
-                    'Latitude': station.latitude or '',
-                    'Longitude': station.longitude or '',
-                    'ZipCodes': ', '.join(station.zip_codes),
-                    'SitingDesc': station.siting_desc
-                }
-                writer.writerow(row)
-        
-        return str(filename)
+        return self._write_csv_rows(filename, STATION_CSV_COLUMNS, zip(*column_values))
     
     def get_data_and_export_csv(self,
                                 targets: Union[str, List[str]], 
@@ -4,18 +4,53 @@ Centralized endpoint handling for the Python CIMIS API client.
 This module contains all API endpoint configurations and request handling logic.
 """
 
+import math
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Union, List
 from datetime import datetime, date
 
 
+# Shared DataValue instances keyed by (value, qc, unit); weather responses
+# repeat the same combinations across records, and DataValue is immutable
+DATA_VALUE_CACHE_SIZE = 4096
+_data_value_cache: Dict[tuple, Any] = {}
+
+
+@lru_cache(maxsize=512)
+def _format_ymd(year: int, month: int, day: int) -> str:
+    """Format a calendar date as YYYY-MM-DD (memoized)."""
+    return date(year, month, day).strftime('%Y-%m-%d')
+
+
+def _format_date(value: date) -> str:
+    """Format a date or datetime as YYYY-MM-DD."""
+    # Key the cache on the calendar fields, not the object: aware datetimes
+    # for the same instant compare equal even when their local dates differ
+    return _format_ymd(value.year, value.month, value.day)
+
+
+def _build_full_urls(base_url: str, endpoints) -> Dict[str, str]:
+    """Join the base URL to every endpoint that takes no parameters."""
+    return {key: f"{base_url}/{template}"
+            for key, template in endpoints.items() if '{' not in template}
+
+
+@lru_cache(maxsize=2048)
+def _build_url(base_url: str, endpoint_template: str, kwargs_items: tuple) -> str:
+    """Format an endpoint template and join it to the base URL (memoized)."""
+    return f"{base_url}/{endpoint_template.format(**dict(kwargs_items))}"
+
+
 class CimisEndpoints:
     """Centralized handling of CIMIS API endpoints and request configurations."""
     
     # Base API URL
     BASE_URL = "https://et.water.ca.gov/api"
     
-    # Endpoint configurations
-    ENDPOINTS = {
+    # Endpoint configurations (read-only)
+    ENDPOINTS = MappingProxyType({
         'data': 'data',
         'station': 'station/{station_id}',
         'stations': 'station',
@@ -23,7 +58,13 @@ class CimisEndpoints:
         'zip_codes': 'stationzipcode',
         'spatial_zip_code': 'spatialzipcode/{zip_code}',
         'spatial_zip_codes': 'spatialzipcode'
-    }
+    })
+    
+    # Full URLs of the parameterless endpoints, with the base URL and
+    # endpoints they were built from so overrides fall back to get_url's
+    # formatting path
+    _FULL_URLS = _build_full_urls(BASE_URL, ENDPOINTS)
+    _FULL_URLS_SOURCE = (BASE_URL, ENDPOINTS)
     
     # Default data items for comprehensive data collection
     DEFAULT_DAILY_DATA_ITEMS = [
@@ -44,8 +85,12 @@ class CimisEndpoints:
         "hly-wind-dir", "hly-wind-spd"
     ]
     
-    # Error codes mapping
-    ERROR_CODES = {
+    # Default data items as sent in the dataItems parameter
+    _DEFAULT_DAILY_DATA_ITEMS_STR = ','.join(DEFAULT_DAILY_DATA_ITEMS)
+    _ALL_DATA_ITEMS_STR = ','.join(DEFAULT_DAILY_DATA_ITEMS + DEFAULT_HOURLY_DATA_ITEMS)
+    
+    # Error codes mapping (read-only)
+    ERROR_CODES = MappingProxyType({
         "ERR1006": "INVALID APP KEY",
         "ERR1019": "STATION NOT FOUND",
         "ERR1031": "UNSUPPORTED ZIP CODE",
@@ -61,7 +106,7 @@ class CimisEndpoints:
         "ERR1012": "DATE ORDER FAULT",
         "ERR1032": "INVALID UNIT OF MEASURE",
         "ERR2112": "DATA VOLUME VIOLATION"
-    }
+    })
     
     @classmethod
     def get_url(cls, endpoint: str, **kwargs) -> str:
@@ -75,13 +120,25 @@ class CimisEndpoints:
         Returns:
             Full URL for the endpoint
         """
+        if not kwargs:
+            base_url, endpoints = cls._FULL_URLS_SOURCE
+            if cls.BASE_URL == base_url and cls.ENDPOINTS is endpoints:
+                full_url = cls._FULL_URLS.get(endpoint)
+                if full_url is not None:
+                    return full_url
+        
         endpoint_template = cls.ENDPOINTS.get(endpoint)
         if not endpoint_template:
             raise ValueError(f"Unknown endpoint: {endpoint}")
         
-        # Format the endpoint with provided kwargs
-        formatted_endpoint = endpoint_template.format(**kwargs)
-        return f"{cls.BASE_URL}/{formatted_endpoint}"
+        # Format the endpoint with provided kwargs; the base URL and template
+        # are part of the cache key so overriding them is still honoured
+        try:
+            return _build_url(cls.BASE_URL, endpoint_template, tuple(sorted(kwargs.items())))
+        except TypeError:
+            # Unhashable parameter values can't be cached
+            formatted_endpoint = endpoint_template.format(**kwargs)
+            return f"{cls.BASE_URL}/{formatted_endpoint}"
     
     @classmethod
     def prepare_data_request_params(cls,
@@ -109,32 +166,25 @@ class CimisEndpoints:
         """
         # Format dates
         if isinstance(start_date, (date, datetime)):
-            start_date = start_date.strftime('%Y-%m-%d')
+            start_date = _format_date(start_date)
         if isinstance(end_date, (date, datetime)):
-            end_date = end_date.strftime('%Y-%m-%d')
+            end_date = _format_date(end_date)
         
         # Format targets
-        if isinstance(targets, list):
-            # Determine the type of targets and format accordingly
-            if cls._is_coordinate_list(targets):
-                targets_str = ';'.join(targets)
-            elif cls._is_address_list(targets):
-                targets_str = ';'.join(targets)
-            else:
-                targets_str = ','.join(map(str, targets))
-        else:
-            targets_str = str(targets)
+        targets_str = cls._format_targets(targets)
         
         # Use default data items if none provided
         if data_items is None:
-            data_items = cls.DEFAULT_DAILY_DATA_ITEMS.copy()
+            data_items_str = cls._DEFAULT_DAILY_DATA_ITEMS_STR
+        else:
+            data_items_str = ','.join(data_items)
         
         return {
             'appKey': app_key,
             'targets': targets_str,
             'startDate': start_date,
             'endDate': end_date,
-            'dataItems': ','.join(data_items),
+            'dataItems': data_items_str,
             'unitOfMeasure': unit_of_measure,
             'prioritizeSCS': 'Y' if prioritize_scs else 'N'
         }
@@ -152,6 +202,34 @@ class CimisEndpoints:
         """
         return {'appKey': app_key}
     
+    @classmethod
+    def _format_targets(cls, targets: Union[str, List[str]]) -> str:
+        """Join a targets list with the separator its target type needs."""
+        if isinstance(targets, list):
+            # Coordinates and addresses contain commas, so they are separated by ';'
+            if cls._classify_targets(targets) != 'other':
+                return ';'.join(targets)
+            return ','.join(map(str, targets))
+        return str(targets)
+    
+    @classmethod
+    def _classify_targets(cls, targets: List[str]) -> str:
+        """
+        Classify a targets list in a single pass.
+        
+        Returns:
+            'coordinate' if any target is a coordinate, otherwise 'address' if
+            any target is an address, otherwise 'other'
+        """
+        kind = 'other'
+        for target in targets:
+            target = str(target)
+            if 'lat=' in target and 'lng=' in target:
+                return 'coordinate'
+            if 'addr-name=' in target and 'addr=' in target:
+                kind = 'address'
+        return kind
+    
     @classmethod
     def _is_coordinate_list(cls, targets: List[str]) -> bool:
         """Check if targets list contains coordinates."""
@@ -224,31 +302,24 @@ class CimisEndpoints:
         """
         # Format dates
         if isinstance(start_date, (date, datetime)):
-            start_date = start_date.strftime('%Y-%m-%d')
+            start_date = _format_date(start_date)
         if isinstance(end_date, (date, datetime)):
-            end_date = end_date.strftime('%Y-%m-%d')
+            end_date = _format_date(end_date)
         
         # Format targets
-        if isinstance(targets, list):
-            # Determine the type of targets and format accordingly
-            if cls._is_coordinate_list(targets):
-                targets_str = ';'.join(targets)
-            elif cls._is_address_list(targets):
-                targets_str = ';'.join(targets)
-            else:
-                targets_str = ','.join(map(str, targets))
-        else:
-            targets_str = str(targets)
+        targets_str = cls._format_targets(targets)
         
         # Use all available data items if none provided
         if items is None or len(items) == 0:
-            items = cls.get_all_data_items()
+            items_str = cls._ALL_DATA_ITEMS_STR
+        else:
+            items_str = ','.join(items)
         
         params = {
             'targets': targets_str,
             'startDate': start_date,
             'endDate': end_date,
-            'dataItems': ','.join(items),
+            'dataItems': items_str,
             'unitOfMeasure': measure_unit,
             'prioritizeSri': 'true' if prioritize_sri else 'false',
             'prioritizeSCS': 'Y' if prioritize_scs else 'N'
@@ -260,8 +331,19 @@ class CimisEndpoints:
         return params
     
     @classmethod
-    def parse_data_response(cls, data: Dict[str, Any]) -> 'WeatherData':
-        """Parse weather data response into WeatherData object."""
+    def parse_data_response(cls, data: Dict[str, Any],
+                            scope_filter: Optional[str] = None) -> 'WeatherData':
+        """
+        Parse weather data response into WeatherData object.
+        
+        Args:
+            data: Decoded JSON response from the data endpoint
+            scope_filter: Only keep records with this scope ('daily' or 'hourly');
+                providers left without records are dropped. Keeps all if None.
+            
+        Returns:
+            WeatherData object
+        """
         from .models import WeatherData, WeatherProvider, WeatherRecord, DataValue
         
         weather_data = WeatherData()
@@ -275,34 +357,117 @@ class CimisEndpoints:
                 type=provider_data.get('Type', ''),
                 owner=provider_data.get('Owner', '')
             )
+            add_record = provider.records.append
+            get_cached_value = _data_value_cache.get
             
+            # Hot loop: runs once per record and data item, so lookups are
+            # bound to locals and objects are built with positional arguments
             for record_data in provider_data.get('Records', []):
-                record = WeatherRecord(
-                    date=record_data.get('Date', ''),
-                    julian=record_data.get('Julian', ''),
-                    station=record_data.get('Station'),
-                    standard=record_data.get('Standard', 'english'),
-                    zip_codes=record_data.get('ZipCodes', ''),
-                    scope=record_data.get('Scope', 'daily'),
-                    hour=record_data.get('Hour')
-                )
+                get = record_data.get
+                scope = get('Scope', 'daily')
+                if scope_filter is not None and scope != scope_filter:
+                    continue
                 
-                # Parse data values
+                # Parse data values, reusing DataValue instances for repeated cells
+                data_values = {}
                 for key, value in record_data.items():
                     if isinstance(value, dict) and 'Value' in value:
-                        data_value = DataValue(
-                            value=value.get('Value'),
-                            qc=value.get('Qc', ' '),
-                            unit=value.get('Unit', '')
-                        )
-                        record.data_values[key] = data_value
+                        value_key = (value.get('Value'), value.get('Qc', ' '), value.get('Unit', ''))
+                        data_value = get_cached_value(value_key)
+                        if data_value is None:
+                            data_value = DataValue(*value_key)
+                            if len(_data_value_cache) < DATA_VALUE_CACHE_SIZE:
+                                _data_value_cache[value_key] = data_value
+                        data_values[key] = data_value
                 
-                provider.records.append(record)
+                # Arguments follow the WeatherRecord field order
+                add_record(WeatherRecord(
+                    get('Date', ''),
+                    get('Julian', ''),
+                    get('Station'),
+                    get('Standard', 'english'),
+                    get('ZipCodes', ''),
+                    scope,
+                    get('Hour'),
+                    data_values
+                ))
             
-            weather_data.providers.append(provider)
+            if scope_filter is None or provider.records:
+                weather_data.providers.append(provider)
         
         return weather_data
     
+    @classmethod
+    def parse_data_frame(cls, data: Dict[str, Any],
+                         scope_filter: Optional[str] = None) -> 'WeatherFrame':
+        """
+        Parse weather data response into a column-oriented WeatherFrame.
+        
+        Args:
+            data: Decoded JSON response from the data endpoint
+            scope_filter: Only keep records with this scope ('daily' or 'hourly').
+                Keeps all if None.
+            
+        Returns:
+            WeatherFrame object
+        """
+        from .models import WeatherFrame
+        
+        frame = WeatherFrame()
+        
+        if 'Data' not in data or 'Providers' not in data['Data']:
+            return frame
+        
+        # First pass: select records and collect data item names so that
+        # every column can be allocated once at its final size
+        selected = []
+        data_items: Dict[str, None] = {}
+        for provider_data in data['Data']['Providers']:
+            provider_name = provider_data.get('Name', '')
+            provider_type = provider_data.get('Type', '')
+            for record_data in provider_data.get('Records', []):
+                if scope_filter is not None and record_data.get('Scope', 'daily') != scope_filter:
+                    continue
+                selected.append((provider_name, provider_type, record_data))
+                for key, value in record_data.items():
+                    if isinstance(value, dict) and 'Value' in value:
+                        data_items[key] = None
+        
+        n_records = len(selected)
+        missing = array('d', [math.nan]) * n_records
+        values = {item: array('d', missing) for item in data_items}
+        qc = {item: [''] * n_records for item in data_items}
+        units = frame.units
+        
+        frame.provider_names = [provider_name for provider_name, _, _ in selected]
+        frame.provider_types = [provider_type for _, provider_type, _ in selected]
+        records = [record_data for _, _, record_data in selected]
+        frame.dates = [record_data.get('Date', '') for record_data in records]
+        frame.julians = [record_data.get('Julian', '') for record_data in records]
+        frame.stations = [record_data.get('Station') for record_data in records]
+        frame.hours = [record_data.get('Hour') for record_data in records]
+        frame.scopes = [record_data.get('Scope', 'daily') for record_data in records]
+        
+        # Second pass: fill the data item columns by row position
+        for row, record_data in enumerate(records):
+            for key, value in record_data.items():
+                column = values.get(key)
+                if column is None or not isinstance(value, dict):
+                    continue
+                raw_value = value.get('Value')
+                if raw_value:
+                    try:
+                        column[row] = float(raw_value)
+                    except (ValueError, TypeError):
+                        pass
+                qc[key][row] = value.get('Qc', ' ')
+                if key not in units and value.get('Unit'):
+                    units[key] = value['Unit']
+        
+        frame.values = values
+        frame.qc = qc
+        return frame
+    
     @classmethod
     def parse_stations_response(cls, data: Dict[str, Any]) -> List['Station']:
         """Parse stations response into list of Station objects."""
@@ -311,23 +476,7 @@ class CimisEndpoints:
         stations = []
         
         for station_data in data.get('Stations', []):
-            station = Station(
-                station_nbr=station_data.get('StationNbr', ''),
-                name=station_data.get('Name', ''),
-                city=station_data.get('City', ''),
-                regional_office=station_data.get('RegionalOffice'),
-                county=station_data.get('County'),
-                connect_date=station_data.get('ConnectDate', ''),
-                disconnect_date=station_data.get('DisconnectDate', ''),
-                is_active=station_data.get('IsActive', 'True').lower() == 'true',
-                is_eto_station=station_data.get('IsEtoStation', 'True').lower() == 'true',
-                elevation=station_data.get('Elevation', ''),
-                ground_cover=station_data.get('GroundCover', ''),
-                hms_latitude=station_data.get('HmsLatitude', ''),
-                hms_longitude=station_data.get('HmsLongitude', ''),
-                zip_codes=station_data.get('ZipCodes', []),
-                siting_desc=station_data.get('SitingDesc', '')
-            )
+            station = Station._from_json(station_data)
             stations.append(station)
         
         return stations
@@ -339,13 +488,7 @@ class CimisEndpoints:
         
         zip_codes = []
         for zip_data in data.get('ZipCodes', []):
-            zip_code_obj = ZipCode(
-                zip_code=zip_data.get('ZipCode', ''),
-                station_nbr=str(zip_data.get('StationNbr', '')),
-                connect_date=zip_data.get('ConnectDate', ''),
-                disconnect_date=zip_data.get('DisconnectDate', ''),
-                is_active=zip_data.get('IsActive', 'True').lower() == 'true'
-            )
+            zip_code_obj = ZipCode._from_json(zip_data)
             zip_codes.append(zip_code_obj)
         
         return zip_codes
@@ -357,14 +500,7 @@ class CimisEndpoints:
         
         zip_codes = []
         for zip_data in data.get('ZipCodes', []):
-            zip_code_obj = SpatialZipCode(
-                zip_code=zip_data.get('ZipCode', ''),
-                city=zip_data.get('City', ''),
-                county=zip_data.get('County', ''),
-                connect_date=zip_data.get('ConnectDate', ''),
-                disconnect_date=zip_data.get('DisconnectDate', ''),
-                is_active=zip_data.get('IsActive', 'True').lower() == 'true'
-            )
+            zip_code_obj = SpatialZipCode._from_json(zip_data)
             zip_codes.append(zip_code_obj)
         
         return zip_codes
@@ -2,14 +2,26 @@
 Data models for the Python CIMIS Client library.
 """
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Any, Union
 from datetime import datetime
 
+# Slotted dataclasses (no per-instance __dict__) for the models created in
+# bulk; dataclass(slots=True) needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class DataValue:
-    """Represents a single data value with quality control information."""
+    """
+    Represents a single data value with quality control information.
+    
+    Instances are immutable because the parser shares them between records.
+    """
     value: Optional[str]
     qc: str = " "  # Quality control flag
     unit: str = ""
@@ -23,7 +35,7 @@ class DataValue:
             return None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WeatherRecord:
     """Represents a single weather data record."""
     date: str
@@ -66,18 +78,86 @@ class WeatherData:
             all_records.extend(provider.records)
         return all_records
     
+    def iter_all_records(self) -> Iterator[WeatherRecord]:
+        """Iterate over all weather records from all providers without copying them."""
+        return chain.from_iterable(provider.records for provider in self.providers)
+    
     def get_records_by_station(self, station_number: str) -> List[WeatherRecord]:
         """Get all records for a specific station."""
-        return [record for record in self.get_all_records() 
+        # Scanned on every call: providers, records and record fields are all
+        # public and mutable, so a cached index could silently go stale
+        return [record for record in self.iter_all_records()
                 if record.station == station_number]
     
     def get_records_by_date(self, date: str) -> List[WeatherRecord]:
         """Get all records for a specific date."""
-        return [record for record in self.get_all_records() 
+        return [record for record in self.iter_all_records()
                 if record.date == date]
 
 
 @dataclass
+class WeatherFrame:
+    """
+    Column-oriented view of weather data records.
+    
+    Row ``i`` of every column belongs to the same record. Data item values are
+    stored as float arrays (NaN for missing or non-numeric values) with QC flags
+    kept per row and a single unit per item, so no DataValue object is created
+    per record and data item.
+    """
+    provider_names: List[str] = field(default_factory=list)
+    provider_types: List[str] = field(default_factory=list)
+    dates: List[str] = field(default_factory=list)
+    julians: List[str] = field(default_factory=list)
+    stations: List[Optional[str]] = field(default_factory=list)
+    hours: List[Optional[str]] = field(default_factory=list)
+    scopes: List[str] = field(default_factory=list)
+    values: Dict[str, array] = field(default_factory=dict)
+    qc: Dict[str, List[str]] = field(default_factory=dict)
+    units: Dict[str, str] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        """Number of records (rows) in the frame."""
+        return len(self.dates)
+    
+    @property
+    def data_items(self) -> List[str]:
+        """Names of the data items present in the frame."""
+        return list(self.values)
+    
+    def get_values(self, data_item: str) -> Optional[array]:
+        """Get the value column for a specific data item."""
+        return self.values.get(data_item)
+    
+    def to_dataframe(self):
+        """
+        Convert the frame to a pandas DataFrame.
+        
+        Requires pandas, which is not installed with this package. The index is
+        (provider, station, date, hour) and each data item gives ``_Value``,
+        ``_Qc`` and ``_Unit`` columns.
+        
+        Returns:
+            pandas.DataFrame with one row per record
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for WeatherFrame.to_dataframe()") from None
+        
+        index = pd.MultiIndex.from_arrays(
+            [self.provider_names, self.stations, self.dates, self.hours],
+            names=['provider', 'station', 'date', 'hour']
+        )
+        columns = {}
+        for data_item, values in self.values.items():
+            columns[f"{data_item}_Value"] = values
+            columns[f"{data_item}_Qc"] = self.qc[data_item]
+            columns[f"{data_item}_Unit"] = self.units.get(data_item, '')
+        return pd.DataFrame(columns, index=index)
+
+
+@dataclass(**_SLOTS)
 class Station:
     """Represents a CIMIS weather station."""
     station_nbr: str
@@ -96,30 +176,68 @@ class Station:
     zip_codes: List[str] = field(default_factory=list)
     siting_desc: str = ""
     
+    @classmethod
+    def _from_json(cls, station_data: Dict[str, Any]) -> 'Station':
+        """
+        Create a Station from a stations API record.
+        
+        Sets every field directly on a new instance instead of going through
+        the generated keyword __init__, which is measurably slower in bulk.
+        """
+        get = station_data.get
+        station = cls.__new__(cls)
+        station.station_nbr = get('StationNbr', '')
+        station.name = get('Name', '')
+        station.city = get('City', '')
+        station.regional_office = get('RegionalOffice')
+        station.county = get('County')
+        station.connect_date = get('ConnectDate', '')
+        station.disconnect_date = get('DisconnectDate', '')
+        station.is_active = get('IsActive', 'True').lower() == 'true'
+        station.is_eto_station = get('IsEtoStation', 'True').lower() == 'true'
+        station.elevation = get('Elevation', '')
+        station.ground_cover = get('GroundCover', '')
+        station.hms_latitude = get('HmsLatitude', '')
+        station.hms_longitude = get('HmsLongitude', '')
+        station.zip_codes = get('ZipCodes', [])
+        station.siting_desc = get('SitingDesc', '')
+        return station
+    
     @property
     def latitude(self) -> Optional[float]:
         """Extract decimal latitude from HMS format."""
-        try:
-            if "/" in self.hms_latitude:
-                decimal_part = self.hms_latitude.split("/")[1].strip()
-                return float(decimal_part)
-        except (ValueError, IndexError):
-            pass
-        return None
+        return _parse_hms_decimal(self.hms_latitude)
     
     @property
     def longitude(self) -> Optional[float]:
         """Extract decimal longitude from HMS format."""
-        try:
-            if "/" in self.hms_longitude:
-                decimal_part = self.hms_longitude.split("/")[1].strip()
-                return float(decimal_part)
-        except (ValueError, IndexError):
-            pass
-        return None
+        return _parse_hms_decimal(self.hms_longitude)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _parse_hms_decimal(hms: str) -> Optional[float]:
+    """
+    Extract the decimal degrees from an HMS coordinate string.
+    
+    Cached by string value, so repeated reads of a station's coordinates
+    parse each value only once while staying correct if it is reassigned.
+    
+    Args:
+        hms: Coordinate such as "38º35'50N / 38.597158"
+        
+    Returns:
+        Decimal degrees, or None if the string has no decimal part
+    """
+    try:
+        if "/" in hms:
+            decimal_part = hms.split("/")[1].strip()
+            return float(decimal_part)
+    except (ValueError, IndexError):
+        pass
+    return None
+
+
+@dataclass(**_SLOTS)
 class ZipCode:
     """Represents a zip code with CIMIS support information."""
     zip_code: str
@@ -127,9 +245,21 @@ class ZipCode:
     connect_date: str = ""
     disconnect_date: str = ""
     is_active: bool = True
+    
+    @classmethod
+    def _from_json(cls, zip_data: Dict[str, Any]) -> 'ZipCode':
+        """Create a ZipCode from a station zip codes API record."""
+        get = zip_data.get
+        zip_code = cls.__new__(cls)
+        zip_code.zip_code = get('ZipCode', '')
+        zip_code.station_nbr = str(get('StationNbr', ''))
+        zip_code.connect_date = get('ConnectDate', '')
+        zip_code.disconnect_date = get('DisconnectDate', '')
+        zip_code.is_active = get('IsActive', 'True').lower() == 'true'
+        return zip_code
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SpatialZipCode:
     """Represents a spatial zip code supported by SCS."""
     zip_code: str
@@ -138,3 +268,16 @@ class SpatialZipCode:
     connect_date: str = ""
     disconnect_date: str = ""
     is_active: bool = True
+    
+    @classmethod
+    def _from_json(cls, zip_data: Dict[str, Any]) -> 'SpatialZipCode':
+        """Create a SpatialZipCode from a spatial zip codes API record."""
+        get = zip_data.get
+        zip_code = cls.__new__(cls)
+        zip_code.zip_code = get('ZipCode', '')
+        zip_code.city = get('City', '')
+        zip_code.county = get('County', '')
+        zip_code.connect_date = get('ConnectDate', '')
+        zip_code.disconnect_date = get('DisconnectDate', '')
+        zip_code.is_active = get('IsActive', 'True').lower() == 'true'
+        return zip_code
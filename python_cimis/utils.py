@@ -5,14 +5,47 @@ This module provides helper functions for filename generation, data formatting,
 and other utility operations.
 """
 
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import Iterable, List, Optional, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .models import WeatherData, Station
 
+# Patterns used on every generated filename
+_RE_NAME_STRIP = re.compile(r'[^\w\s-]')
+_RE_NAME_COLLAPSE = re.compile(r'[-\s]+')
+_RE_UNDERSCORES = re.compile(r'_+')
+
+# Characters not allowed in filenames, all replaced by '_' in one pass
+_INVALID_FILENAME_TRANS = str.maketrans({char: '_' for char in '<>:"|?*'})
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name_cached(name: str) -> str:
+    """Sanitize a name for use in filename (memoized, names repeat across exports)."""
+    if not name:
+        return "unnamed"
+    
+    # Remove special characters and spaces
+    sanitized = _RE_NAME_STRIP.sub('', name)
+    sanitized = _RE_NAME_COLLAPSE.sub('', sanitized)
+    
+    return sanitized[:50]  # Limit length
+
+
+def _compact_date(date_str: str) -> str:
+    """Convert a date string to YYYYMMDD format by dropping dashes."""
+    # CIMIS dates are YYYY-MM-DD; slice that shape directly
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        compact = date_str[:4] + date_str[5:7] + date_str[8:]
+        if compact.isdigit():
+            return compact
+    return date_str.replace('-', '')
+
 
 class FilenameGenerator:
     """
@@ -22,6 +55,9 @@ class FilenameGenerator:
     - Data types (weather data, stations, etc.)
     """
     
+    # base_directory is a property over _base_directory
+    __slots__ = ('_base_directory', '_base_str')
+    
     def __init__(self, base_directory: Optional[Union[str, Path]] = None):
         """
         Initialize the filename generator.
@@ -29,44 +65,105 @@ class FilenameGenerator:
         Args:
             base_directory: Base directory for file output (uses current directory if None)
         """
-        self.base_directory = Path(base_directory) if base_directory else Path.cwd()
+        if isinstance(base_directory, Path):
+            self.base_directory = base_directory
+        else:
+            self.base_directory = Path(base_directory) if base_directory else Path.cwd()
+    
+    @property
+    def base_directory(self) -> Path:
+        """Base directory for file output."""
+        return self._base_directory
     
-    def generate_weather_filename(self, weather_data: 'WeatherData') -> str:
+    @base_directory.setter
+    def base_directory(self, directory: Path) -> None:
+        self._base_directory = directory
+        # String prefix for generated filenames, so joining them does not
+        # build a Path per call ('.' is dropped, as Path joining does)
+        base = str(directory)
+        self._base_str = '' if base == '.' else os.path.join(base, '')
+    
+    def generate_weather_filename(self, weather_data: 'WeatherData',
+                                  start_date: Optional[str] = None,
+                                  end_date: Optional[str] = None) -> str:
         """
         Generate filename for weather data export.
         
         Args:
             weather_data: WeatherData object containing the data
+            start_date: Requested start date (YYYY-MM-DD); with end_date, used
+                instead of scanning the records for dates
+            end_date: Requested end date (YYYY-MM-DD)
             
         Returns:
             Generated filename with full path
         """
-        # Extract station information and date ranges
-        stations = []
-        dates = []
+        # Extract unique station information and dates; sets only grow with
+        # the number of distinct values, not the number of records
+        station_set = set()
+        date_set = set()
+        
+        if start_date and end_date:
+            for provider in weather_data.providers:
+                for record in provider.records:
+                    if record.station:
+                        station_set.add(record.station)
+            date_set = self._request_dates(start_date, end_date)
+        else:
+            for provider in weather_data.providers:
+                for record in provider.records:
+                    if record.station:
+                        station_set.add(record.station)
+                    date_set.add(record.date)
         
-        for provider in weather_data.providers:
-            for record in provider.records:
-                if record.station:
-                    stations.append(f"Station{record.station}")
-                dates.append(record.date)
+        return self._weather_filename(station_set, date_set)
+    
+    def generate_weather_filename_from_request(self, targets: List[str],
+                                               start_date: str, end_date: str) -> str:
+        """
+        Generate filename for weather data export from the request parameters.
         
-        # Remove duplicates and sort
-        unique_stations = sorted(set(stations))
-        unique_dates = sorted(set(dates))
+        Used when the file is written before any records are parsed. Targets
+        take the place of the record station numbers, so station requests get
+        the same name as generate_weather_filename would give them.
+        
+        Args:
+            targets: Requested station numbers, zip codes, coordinates or addresses
+            start_date: Requested start date (YYYY-MM-DD)
+            end_date: Requested end date (YYYY-MM-DD)
+            
+        Returns:
+            Generated filename with full path
+        """
+        return self._weather_filename(set(targets), self._request_dates(start_date, end_date))
+    
+    def _request_dates(self, start_date: str, end_date: str) -> set:
+        """Clean caller-supplied dates so they cannot add path separators."""
+        return {self._sanitize_name(start_date), self._sanitize_name(end_date)}
+    
+    def _weather_filename(self, station_set: set, date_set: set) -> str:
+        """Build a weather data filename from distinct stations and dates."""
+        # Label only the distinct stations, then sort for consistent naming
+        unique_stations = sorted({f"Station{station}" for station in station_set})
+        # Only the earliest and latest dates are used; ISO date strings
+        # order correctly, so min/max is enough without sorting them all
+        if len(date_set) > 1:
+            unique_dates = [min(date_set), max(date_set)]
+        else:
+            unique_dates = list(date_set)
         
         # Create filename components
+        timestamp_part = self._now_stamp()
         station_part = self._format_station_names(unique_stations)
-        date_part = self._format_date_range(unique_dates)
-        timestamp_part = datetime.now().strftime("%Y%m%d_%H%M%S")
+        date_part = self._format_date_range(unique_dates, timestamp_part)
         
         # Combine components
         filename = f"cimis_weather_data_{station_part}_{date_part}_{timestamp_part}.csv"
         
         # Ensure filename is valid and not too long
-        filename = self._sanitize_filename(filename)
+        filename = self._sanitize_filename(filename, timestamp_part)
         
-        return str(self.base_directory / filename)
+        return self._join_base(filename)
     
     def generate_stations_filename(self, stations: List['Station']) -> str:
         """
@@ -78,24 +175,58 @@ class FilenameGenerator:
         Returns:
             Generated filename with full path
         """
+        return self._stations_filename(stations, self._now_stamp())
+    
+    def generate_stations_filenames_batch(self, station_groups: Iterable[List['Station']]) -> List[str]:
+        """
+        Generate filenames for several station data exports at once.
+        
+        All filenames share one timestamp, and repeated station names are
+        only sanitized once. Groups that would get the same name (e.g. two
+        empty groups, or two large groups starting with the same station)
+        are kept apart by a ``_2``, ``_3``, ... suffix before ``.csv``, so
+        every returned path is unique within the batch.
+        
+        Args:
+            station_groups: Lists of Station objects, one per export
+            
+        Returns:
+            Generated filenames with full path, in the order of the groups
+        """
+        timestamp = self._now_stamp()
+        filenames = []
+        seen = set()
+        for stations in station_groups:
+            filename = self._stations_filename(stations, timestamp)
+            if filename in seen:
+                base = filename[:-len('.csv')]
+                count = 2
+                while f"{base}_{count}.csv" in seen:
+                    count += 1
+                filename = f"{base}_{count}.csv"
+            seen.add(filename)
+            filenames.append(filename)
+        return filenames
+    
+    def _stations_filename(self, stations: List['Station'], timestamp: str) -> str:
+        """Build a station data filename using the given timestamp."""
         if not stations:
             station_part = "all_stations"
         else:
-            station_names = [self._sanitize_name(station.name) for station in stations[:5]]
+            # Clean only the station names that end up in the filename
             if len(stations) == 1:
-                station_part = station_names[0]
+                station_part = self._sanitize_name(stations[0].name)
             elif len(stations) <= 3:
-                station_part = "_".join(station_names)
+                station_part = "_".join(self._sanitize_name(station.name) for station in stations)
             else:
-                station_part = f"{station_names[0]}_plus{len(stations)-1}more"
+                station_part = f"{self._sanitize_name(stations[0].name)}_plus{len(stations)-1}more"
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"cimis_stations_{station_part}_{timestamp}.csv"
         
         # Ensure filename is valid
-        filename = self._sanitize_filename(filename)
+        filename = self._sanitize_filename(filename, timestamp)
         
-        return str(self.base_directory / filename)
+        return self._join_base(filename)
     
     def generate_zip_codes_filename(self, zip_codes: List[str]) -> str:
         """
@@ -116,13 +247,13 @@ class FilenameGenerator:
         else:
             zip_part = f"{len(zip_codes)}_zipcodes"
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = self._now_stamp()
         filename = f"cimis_zipcode_data_{zip_part}_{timestamp}.csv"
         
         # Ensure filename is valid
-        filename = self._sanitize_filename(filename)
+        filename = self._sanitize_filename(filename, timestamp)
         
-        return str(self.base_directory / filename)
+        return self._join_base(filename)
     
     def generate_custom_filename(self, 
                                 data_type: str, 
@@ -139,135 +270,145 @@ class FilenameGenerator:
         Returns:
             Generated filename with full path
         """
-        components = ['cimis', data_type]
-        
+        identifier_part = ''
         if identifiers:
             if len(identifiers) <= 3:
-                components.extend(identifiers)
+                identifier_part = '_' + '_'.join(identifiers)
             else:
-                components.append(f"{len(identifiers)}_targets")
+                identifier_part = f"_{len(identifiers)}_targets"
         
-        if date_range:
-            components.append(date_range)
+        date_part = f"_{date_range}" if date_range else ''
         
         # Add timestamp
-        components.append(datetime.now().strftime("%Y%m%d_%H%M%S"))
+        timestamp = self._now_stamp()
         
-        filename = '_'.join(components) + '.csv'
-        filename = self._sanitize_filename(filename)
+        filename = f"cimis_{data_type}{identifier_part}{date_part}_{timestamp}.csv"
+        filename = self._sanitize_filename(filename, timestamp)
         
-        return str(self.base_directory / filename)
+        return self._join_base(filename)
     
-    def generate_for_weather_data(self, weather_data: 'WeatherData') -> str:
-        """
-        Generate filename for weather data export.
-        Alias for generate_weather_filename for compatibility.
-        """
-        return self.generate_weather_filename(weather_data)
-    
-    def generate_for_stations(self, stations: List['Station']) -> str:
-        """
-        Generate filename for stations data export.
-        Alias for generate_stations_filename for compatibility.
-        """
-        return self.generate_stations_filename(stations)
+    # Aliases for compatibility
+    generate_for_weather_data = generate_weather_filename
+    generate_for_stations = generate_stations_filename
     
     def _format_station_names(self, stations: List[str]) -> str:
         """Format station names/numbers for filename."""
         if not stations:
             return "unknown"
         
-        # Clean and format station identifiers
-        clean_stations = []
-        for station in stations[:5]:
-            clean_stations.append(self._sanitize_name(station))
-        
+        # Clean only the station identifiers that end up in the name
         if len(stations) == 1:
-            return clean_stations[0]
+            return self._sanitize_name(stations[0])
         elif len(stations) <= 3:
-            return "_".join(clean_stations)
+            return "_".join(self._sanitize_name(station) for station in stations)
         else:
-            return f"{clean_stations[0]}_plus{len(stations)-1}more"
+            return f"{self._sanitize_name(stations[0])}_plus{len(stations)-1}more"
     
-    def _format_date_range(self, dates: List[str]) -> str:
+    def _now_stamp(self) -> str:
+        """Current local time as YYYYMMDD_HHMMSS, read once per generated filename."""
+        # Formatting the fields directly is faster than strftime
+        now = datetime.now()
+        return '%04d%02d%02d_%02d%02d%02d' % (now.year, now.month, now.day,
+                                              now.hour, now.minute, now.second)
+    
+    def _format_date_range(self, dates: List[str], now_stamp: Optional[str] = None) -> str:
         """Format date range for filename."""
         if not dates:
-            return f"unknown_{datetime.now().strftime('%Y%m%d')}"
-        
-        # Convert dates to YYYYMMDD format
-        formatted_dates = []
-        for date_str in dates:
-            try:
-                # Handle different date formats
-                if '-' in date_str:
-                    formatted_dates.append(date_str.replace('-', ''))
-                else:
-                    formatted_dates.append(date_str)
-            except:
-                continue
+            return f"unknown_{(now_stamp or self._now_stamp())[:8]}"
+        
+        # Only the first and last dates appear in the name, so convert just
+        # those to YYYYMMDD format
+        first_date, last_date = dates[0], dates[-1]
+        if isinstance(first_date, str) and isinstance(last_date, str):
+            if len(dates) == 1:
+                return _compact_date(first_date)
+            return f"{_compact_date(first_date)}_to_{_compact_date(last_date)}"
+        
+        # Skip anything that is not a date string
+        formatted_dates = [_compact_date(date_str) for date_str in dates
+                           if isinstance(date_str, str)]
         
         if len(formatted_dates) == 1:
             return formatted_dates[0]
         elif len(formatted_dates) > 1:
             return f"{formatted_dates[0]}_to_{formatted_dates[-1]}"
         else:
-            return f"unknown_{datetime.now().strftime('%Y%m%d')}"
+            return f"unknown_{(now_stamp or self._now_stamp())[:8]}"
     
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for use in filename."""
-        if not name:
-            return "unnamed"
-        
-        # Remove special characters and spaces
-        sanitized = re.sub(r'[^\w\s-]', '', name)
-        sanitized = re.sub(r'[-\s]+', '', sanitized)
-        
-        return sanitized[:50]  # Limit length
+        return _sanitize_name_cached(name)
     
-    def _sanitize_filename(self, filename: str) -> str:
+    def _sanitize_filename(self, filename: str, now_stamp: Optional[str] = None) -> str:
         """Sanitize filename to ensure it's valid for the filesystem."""
         if not filename:
-            return f"cimis_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            return f"cimis_export_{now_stamp or self._now_stamp()}.csv"
         
         # Remove invalid characters
-        invalid_chars = r'<>:"|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+        filename = filename.translate(_INVALID_FILENAME_TRANS)
         
         # Replace multiple underscores with single
-        filename = re.sub(r'_+', '_', filename)
+        filename = _RE_UNDERSCORES.sub('_', filename)
         
         # Ensure reasonable length
         if len(filename) > 200:
-            base, ext = filename.rsplit('.', 1)
-            filename = base[:190] + f"_{datetime.now().strftime('%H%M%S')}.{ext}"
+            time_part = (now_stamp or self._now_stamp())[9:]
+            if filename.endswith('.csv'):
+                # The base is well over 190 characters, so slicing the whole
+                # name gives the same prefix without splitting off '.csv'
+                filename = f"{filename[:190]}_{time_part}.csv"
+            else:
+                base, ext = filename.rsplit('.', 1)
+                filename = base[:190] + f"_{time_part}.{ext}"
         
         return filename
     
+    def _join_base(self, filename: str) -> str:
+        """Join a generated filename to the base directory."""
+        if os.sep in filename or (os.altsep and os.altsep in filename):
+            # Let Path normalize names that contain separators
+            return str(self.base_directory / filename)
+        return self._base_str + filename
+    
     def set_base_directory(self, directory: Union[str, Path]) -> None:
         """Set the base directory for file output."""
-        self.base_directory = Path(directory)
+        self.base_directory = directory if isinstance(directory, Path) else Path(directory)
+
+
+# Number of generators kept for reuse by the convenience functions
+GENERATOR_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=GENERATOR_CACHE_SIZE)
+def _cached_generator(base_dir: Union[str, Path]) -> FilenameGenerator:
+    return FilenameGenerator(base_dir)
+
+
+def _get_generator(base_dir: Optional[Union[str, Path]]) -> FilenameGenerator:
+    """Get a shared generator for the base directory (current directory if None)."""
+    # Key the default on the current directory so a later chdir is honored
+    return _cached_generator(base_dir or os.getcwd())
 
 
 # Convenience functions for quick filename generation
 def generate_weather_filename(weather_data: 'WeatherData', 
                             base_dir: Optional[Union[str, Path]] = None) -> str:
     """Quick function to generate filename for weather data."""
-    generator = FilenameGenerator(base_dir)
+    generator = _get_generator(base_dir)
     return generator.generate_weather_filename(weather_data)
 
 
 def generate_stations_filename(stations: List['Station'], 
                              base_dir: Optional[Union[str, Path]] = None) -> str:
     """Quick function to generate filename for stations data."""
-    generator = FilenameGenerator(base_dir)
+    generator = _get_generator(base_dir)
     return generator.generate_stations_filename(stations)
 
 
 def generate_zip_codes_filename(zip_codes: List[str], 
                               base_dir: Optional[Union[str, Path]] = None) -> str:
     """Quick function to generate filename for zip codes data."""
-    generator = FilenameGenerator(base_dir)
+    generator = _get_generator(base_dir)
     return generator.generate_zip_codes_filename(zip_codes)
 
 
@@ -276,5 +417,5 @@ def generate_custom_filename(data_type: str,
                            date_range: Optional[str] = None,
                            base_dir: Optional[Union[str, Path]] = None) -> str:
     """Quick function to generate custom filename."""
-    generator = FilenameGenerator(base_dir)
+    generator = _get_generator(base_dir)
     return generator.generate_custom_filename(data_type, identifiers, date_range)
\ No newline at end of file
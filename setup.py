@@ -54,6 +54,9 @@ setup(
             "flake8",
             "mypy",
         ],
+        "fast": [
+            "orjson",
+        ],
         "docs": [
             "sphinx",
             "sphinx-rtd-theme",
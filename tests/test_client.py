@@ -0,0 +1,137 @@
+"""
+Tests for the CimisClient class.
+"""
+
+import copy
+from unittest.mock import patch
+
+import pytest
+
+from python_cimis import CimisClient
+
+
+def make_record(station, date, scope='daily', hour=None, value='12.3', qc=' '):
+    """Build one record as returned by the data endpoint."""
+    record = {
+        'Date': date,
+        'Julian': '1',
+        'Station': station,
+        'Standard': 'english',
+        'ZipCodes': '95616, 95617',
+        'Scope': scope,
+    }
+    if hour is not None:
+        record['Hour'] = hour
+    if scope == 'hourly':
+        record['HlyAirTmp'] = {'Value': value, 'Qc': qc, 'Unit': '(C)'}
+        record['HlyEto'] = {'Value': None, 'Qc': ' ', 'Unit': '(mm)'}
+    else:
+        record['DayAirTmpAvg'] = {'Value': value, 'Qc': qc, 'Unit': '(C)'}
+        record['DayEto'] = {'Value': '0.05', 'Qc': 'Y', 'Unit': '(mm)'}
+    return record
+
+
+def make_response(stations=('2', '5'), dates=('2023-01-01', '2023-01-02')):
+    """Build a data endpoint response with daily and hourly station records."""
+    records = []
+    for station in stations:
+        for date in dates:
+            records.append(make_record(station, date))
+            for hour in ('0100', '1300', '2400'):
+                records.append(make_record(station, date, 'hourly', hour, value='4.5'))
+    # A record with a missing value and a spatial (no station) provider
+    records.append(make_record(stations[0], dates[-1], value=None, qc='M'))
+    spatial = [{
+        'Date': date, 'Julian': '1', 'Standard': 'english', 'ZipCodes': '95616',
+        'Scope': 'daily', 'DayAsceEto': {'Value': '3.2', 'Qc': ' ', 'Unit': '(mm)'},
+    } for date in dates]
+    return {'Data': {'Providers': [
+        {'Name': 'cimis', 'Type': 'station', 'Owner': 'water.ca.gov', 'Records': records},
+        {'Name': 'cimis', 'Type': 'spatial', 'Owner': 'water.ca.gov', 'Records': spatial},
+    ]}}
+
+
+@pytest.fixture
+def client():
+    """Client that never contacts the API."""
+    return CimisClient(app_key='test-key')
+
+
+class TestStreamedCsvExport:
+    @pytest.mark.parametrize('method', ['get_daily_data', 'get_hourly_data'])
+    def test_stream_matches_regular_export(self, client, tmp_path, method):
+        """Test that stream=True writes the same CSV as the parsed export."""
+        response = make_response()
+        fetch = getattr(client, method)
+
+        with patch.object(client, '_make_request',
+                          side_effect=lambda *args, **kwargs: copy.deepcopy(response)):
+            _, regular = fetch(['2', '5'], '2023-01-01', '2023-01-02', csv=True,
+                               filename=tmp_path / 'regular.csv')
+            streamed = fetch(['2', '5'], '2023-01-01', '2023-01-02', csv=True,
+                             filename=tmp_path / 'streamed.csv', stream=True)
+
+        assert streamed == str(tmp_path / 'streamed.csv')
+        regular_bytes = (tmp_path / 'regular.csv').read_bytes()
+        assert regular_bytes
+        assert (tmp_path / 'streamed.csv').read_bytes() == regular_bytes
+
+    def test_stream_filename_is_sanitized(self, client, tmp_path):
+        """Test that streamed default filenames cannot create subdirectories."""
+        client.filename_generator.set_base_directory(tmp_path)
+
+        filename = client._generate_stream_filename(
+            'addr-name=Home,addr=1/2 Main St, Davis CA', '2023-01-01', '2023-01-02'
+        )
+
+        assert filename.startswith(str(tmp_path / 'cimis_weather_data_Station'))
+        assert '/' not in filename[len(str(tmp_path)) + 1:]
+        assert '_20230101_to_20230102_' in filename
+
+
+class TestTargetChunking:
+    @staticmethod
+    def respond_per_target(endpoint, params, **kwargs):
+        """Fake data endpoint returning one daily record per requested station."""
+        return make_response(stations=tuple(params['targets'].split(',')),
+                             dates=('2023-01-01',))
+
+    def test_long_target_list_is_split(self, client):
+        """Test that long target lists are fetched in TARGETS_PER_REQUEST chunks."""
+        targets = [str(number) for number in range(1, 26)]
+
+        with patch('python_cimis.client.TARGETS_PER_REQUEST', 10), \
+                patch.object(client, '_make_request',
+                             side_effect=self.respond_per_target) as mock_request:
+            client.get_data(targets, '2023-01-01', '2023-01-01')
+
+        requested = sorted(call.args[1]['targets'] for call in mock_request.call_args_list)
+        assert requested == sorted([','.join(targets[0:10]), ','.join(targets[10:20]),
+                                    ','.join(targets[20:25])])
+
+    def test_split_results_are_merged_in_target_order(self, client):
+        """Test that chunked responses merge into one provider per name/type/owner."""
+        targets = [str(number) for number in range(1, 26)]
+
+        with patch.object(client, '_make_request', side_effect=self.respond_per_target):
+            weather_data = client.get_data(targets, '2023-01-01', '2023-01-01')
+
+        assert [(provider.name, provider.type) for provider in weather_data.providers] == [
+            ('cimis', 'station'), ('cimis', 'spatial')]
+        station_records = weather_data.providers[0].records
+        daily_stations = [record.station for record in station_records
+                          if record.scope == 'daily']
+        assert list(dict.fromkeys(daily_stations)) == targets
+        assert len(weather_data.providers[1].records) == 3
+
+    def test_single_worker_sends_one_request(self):
+        """Test that max_workers=1 keeps long target lists in a single request."""
+        client = CimisClient(app_key='test-key', max_workers=1)
+        targets = [str(number) for number in range(1, 26)]
+
+        with patch.object(client, '_make_request',
+                          side_effect=self.respond_per_target) as mock_request:
+            weather_data = client.get_data(targets, '2023-01-01', '2023-01-01')
+
+        assert mock_request.call_count == 1
+        assert len(weather_data.providers) == 2
@@ -0,0 +1,79 @@
+"""
+Tests for the CimisEndpoints class.
+"""
+
+import math
+
+from python_cimis.endpoints import CimisEndpoints
+
+
+def make_response():
+    """Build a data endpoint response with missing, bad and mixed-scope values."""
+    records = [
+        {'Date': '2023-01-01', 'Julian': '1', 'Station': '2', 'Scope': 'daily',
+         'DayAirTmpAvg': {'Value': '12.5', 'Qc': ' ', 'Unit': '(C)'},
+         'DayEto': {'Value': None, 'Qc': 'M', 'Unit': '(mm)'}},
+        {'Date': '2023-01-02', 'Julian': '2', 'Station': '2', 'Scope': 'daily',
+         'DayAirTmpAvg': {'Value': 'n/a', 'Qc': 'Y', 'Unit': '(C)'},
+         'DayEto': {'Value': '0.5', 'Qc': ' ', 'Unit': '(mm)'}},
+        {'Date': '2023-01-02', 'Julian': '2', 'Hour': '0100', 'Station': '2', 'Scope': 'hourly',
+         'HlyAirTmp': {'Value': '4', 'Qc': ' ', 'Unit': '(C)'}},
+    ]
+    spatial = [
+        {'Date': '2023-01-01', 'Julian': '1', 'Scope': 'daily',
+         'DayAsceEto': {'Value': '3.2', 'Qc': ' ', 'Unit': '(mm)'}},
+    ]
+    return {'Data': {'Providers': [
+        {'Name': 'cimis', 'Type': 'station', 'Owner': 'water.ca.gov', 'Records': records},
+        {'Name': 'cimis', 'Type': 'spatial', 'Owner': 'water.ca.gov', 'Records': spatial},
+    ]}}
+
+
+class TestParseDataFrame:
+    def test_row_columns(self):
+        """Test that every record becomes one row across the metadata columns."""
+        frame = CimisEndpoints.parse_data_frame(make_response())
+
+        assert len(frame) == 4
+        assert frame.provider_types == ['station', 'station', 'station', 'spatial']
+        assert frame.stations == ['2', '2', '2', None]
+        assert frame.hours == [None, None, '0100', None]
+        assert frame.scopes == ['daily', 'daily', 'hourly', 'daily']
+
+    def test_missing_and_non_numeric_values_are_nan(self):
+        """Test that absent items, None and non-numeric values are NaN."""
+        frame = CimisEndpoints.parse_data_frame(make_response())
+
+        air_temp = frame.get_values('DayAirTmpAvg')
+        assert air_temp[0] == 12.5
+        assert math.isnan(air_temp[1])  # 'n/a'
+        assert math.isnan(air_temp[2])  # hourly record has no daily item
+        eto = frame.get_values('DayEto')
+        assert math.isnan(eto[0])  # None
+        assert eto[1] == 0.5
+        assert math.isnan(frame.get_values('DayAsceEto')[0])
+        assert frame.get_values('DayAsceEto')[3] == 3.2
+
+    def test_qc_and_units(self):
+        """Test that QC flags are kept per row and units once per item."""
+        frame = CimisEndpoints.parse_data_frame(make_response())
+
+        assert frame.qc['DayAirTmpAvg'] == [' ', 'Y', '', '']
+        assert frame.qc['DayEto'] == ['M', ' ', '', '']
+        assert frame.units == {'DayAirTmpAvg': '(C)', 'DayEto': '(mm)',
+                               'HlyAirTmp': '(C)', 'DayAsceEto': '(mm)'}
+
+    def test_scope_filter(self):
+        """Test that scope_filter drops records and items of the other scope."""
+        frame = CimisEndpoints.parse_data_frame(make_response(), scope_filter='daily')
+
+        assert len(frame) == 3
+        assert 'HlyAirTmp' not in frame.data_items
+        assert all(len(column) == 3 for column in frame.values.values())
+
+    def test_empty_response(self):
+        """Test that a response without data gives an empty frame."""
+        frame = CimisEndpoints.parse_data_frame({})
+
+        assert len(frame) == 0
+        assert frame.data_items == []
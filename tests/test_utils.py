@@ -0,0 +1,57 @@
+"""
+Tests for the utility functions and classes.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from python_cimis.models import Station
+from python_cimis.utils import FilenameGenerator
+
+
+def make_station(number, name):
+    """Build a Station with only the fields used for filenames."""
+    return Station(station_nbr=number, name=name, city='')
+
+
+@pytest.fixture
+def generator(tmp_path):
+    """Generator with a fixed timestamp writing under a temporary directory."""
+    generator = FilenameGenerator(tmp_path)
+    with patch.object(FilenameGenerator, '_now_stamp', return_value='20230102_030405'):
+        yield generator
+
+
+class TestStationsFilenamesBatch:
+    def test_names_match_single_generation(self, generator):
+        """Test that distinct groups get the same names as single calls."""
+        davis = make_station('6', 'Davis')
+        fresno = make_station('80', 'Fresno State')
+
+        filenames = generator.generate_stations_filenames_batch([[davis], [davis, fresno]])
+
+        assert filenames == [generator.generate_stations_filename([davis]),
+                             generator.generate_stations_filename([davis, fresno])]
+
+    def test_colliding_names_get_suffixes(self, generator, tmp_path):
+        """Test that groups with the same name are numbered within the batch."""
+        stations = [make_station(str(number), f"Station {number}") for number in range(1, 8)]
+        first_group = stations[:4]
+        second_group = [stations[0]] + stations[4:7]  # also 'Station1_plus3more'
+
+        filenames = generator.generate_stations_filenames_batch(
+            [[], [], first_group, second_group, []]
+        )
+
+        assert filenames == [
+            str(tmp_path / 'cimis_stations_all_stations_20230102_030405.csv'),
+            str(tmp_path / 'cimis_stations_all_stations_20230102_030405_2.csv'),
+            str(tmp_path / 'cimis_stations_Station1_plus3more_20230102_030405.csv'),
+            str(tmp_path / 'cimis_stations_Station1_plus3more_20230102_030405_2.csv'),
+            str(tmp_path / 'cimis_stations_all_stations_20230102_030405_3.csv'),
+        ]
+
+    def test_empty_batch(self, generator):
+        """Test that an empty batch gives no filenames."""
+        assert generator.generate_stations_filenames_batch([]) == []